@@ -1,4 +1,5 @@
 import holidays
+import holidays.countries # not imported implicitly by the top level package
 from datetime import date
 from dateutil.relativedelta import relativedelta, MO#, FR
 # from dateutil.easter import easter
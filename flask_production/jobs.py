@@ -17,6 +17,16 @@ class BadScheduleError(Exception):
 
 
 
+_tz_cache = {}
+
+def get_tz(tzname):
+	'''memoized tz.gettz() - tzinfo objects are immutable and shared freely'''
+	if tzname not in _tz_cache:
+		_tz_cache[tzname] = tz.gettz(tzname)
+	return _tz_cache[tzname]
+
+
+
 def _get_eom(d):
 	return ((d + monthdelta(1)).replace(day=1) - timedelta(days=1))
 
@@ -91,6 +101,7 @@ class Job(object):
 		# signatures for setters and getters
 		self._func_signature = None
 		self._job_signature_hash = None
+		self._schedule_str = None
 		self._on_complete_cbs = []
 		self._on_enable_cbs = []
 		self._on_disable_cbs = []
@@ -168,13 +179,13 @@ class Job(object):
 		return d.timestamp()
 
 	def to_datetime(self, t: float):
-		return dt.fromtimestamp(t, tz=tz.gettz(self.tzname))
+		return dt.fromtimestamp(t, tz=get_tz(self.tzname))
 
 	def tz_now(self):
-		return dt.now(tz=tz.gettz(self.tzname))
+		return dt.now(tz=get_tz(self.tzname))
 
 	def tz_dt(self, year, month, day, hour=0, minute=0, second=0, microsecond=0):
-		d = dt(int(year), int(month), int(day), int(hour), int(minute), int(second), int(microsecond), tzinfo=tz.gettz(self.tzname))
+		d = dt(int(year), int(month), int(day), int(hour), int(minute), int(second), int(microsecond), tzinfo=get_tz(self.tzname))
 		return tz.resolve_imaginary(d) # handles time that falls in the transition to/from daylight savings
 	#
 
@@ -223,9 +234,14 @@ class Job(object):
 	def _job_must_run_today(self, date=None):
 		return RUNABLE_DAYS[self.interval](date or self.tz_now(), self.calendar)
 
-	def is_due(self):
-		'''test if job should run now'''
-		return self.next_timestamp > 0 and (time.time() >= self.next_timestamp) and not self.is_running and not self.is_disabled
+	def is_due(self, now=None):
+		'''
+		test if job should run now
+		- 'now' can be passed in so a scheduler checking many jobs only reads the clock once per tick
+		'''
+		if now is None:
+			now = time.time()
+		return self.next_timestamp > 0 and (now >= self.next_timestamp) and not self.is_running and not self.is_disabled
 
 	def did_fail(self):
 		'''test if job failed'''
@@ -253,6 +269,21 @@ class Job(object):
 				self._func_signature = '{}.{}{}'.format(self.func.__module__, self.func.__qualname__, arguments)
 		return self._func_signature
 
+	def _schedule_description(self, tz_str):
+		at_str = self.time_string
+		if isinstance(at_str, (list,set,tuple)):
+			at_str = ', '.join(at_str)
+		return "every {} at {} {}".format(self.interval, at_str, tz_str)
+
+	def schedule_str(self):
+		'''create human readable schedule description'''
+		if self._schedule_str is None: # schedule is fixed at creation, so this is computed only once
+			tz_str = ''
+			if isinstance(self.tzname, str):
+				tz_str = dt.now(get_tz(self.tzname)).strftime("[%Z]")
+			self._schedule_str = self._schedule_description(tz_str).strip()
+		return self._schedule_str
+
 	def signature_hash(self):
 		'''create unique job signature hash'''
 		if self._job_signature_hash is None:
@@ -356,6 +387,7 @@ class Job(object):
 			type=self.__class__.__name__,
 			every=self.interval,
 			at=self.time_string,
+			schedule_str=self.schedule_str(),
 			tzname=self.tzname,
 			is_running=self.is_running,
 			is_disabled=self.is_disabled,
@@ -384,6 +416,9 @@ class OneTimeJob(Job):
 		except:
 			return False
 
+	def _schedule_description(self, tz_str):
+		return "on {} at {} {}".format(self.interval, self.time_string, tz_str)
+
 	def schedule_next_run(self, just_ran=False):
 		Y, m, d = self.interval.split('-')
 		n = self.tz_dt(int(Y), int(m), int(d))
@@ -394,10 +429,10 @@ class OneTimeJob(Job):
 		else:
 			self.next_timestamp = self.to_timestamp(upcoming)
 
-	def is_due(self):
+	def is_due(self, now=None):
 		if self.next_timestamp==0:
 			return False
-		return super().is_due()
+		return super().is_due(now)
 
 
 class RepeatJob(Job):
@@ -407,6 +442,9 @@ class RepeatJob(Job):
 	def is_valid_interval(cls, interval, time_string):
 		return isinstance(interval, (int, float)) and time_string is None
 
+	def _schedule_description(self, tz_str):
+		return "every {} seconds {}".format(self.interval, tz_str)
+
 	def schedule_next_run(self, just_ran=False):
 		if not isinstance(self.interval, (int, float)) or self.interval <= 0:
 			raise BadScheduleError("Illegal interval for repeating job. Expected number of seconds")
@@ -494,8 +532,8 @@ class AsyncJobWrapper(object):
 	def __getattr__(self, name):
 		return self.job.__getattribute__(name)
 
-	def is_due(self):
-		return self.job.is_due()
+	def is_due(self, now=None):
+		return self.job.is_due(now)
 
 	def run(self, *args, **kwargs):
 		self.proc = threading.Thread(target=self.job.run, args=args, kwargs=kwargs)
@@ -511,8 +549,11 @@ class NeverJob(Job):
 	def is_valid_interval(cls, interval, time_string):
 		return interval in ('on-demand', 'never') and time_string is None
 
+	def _schedule_description(self, tz_str):
+		return 'on-demand'
+
 	def schedule_next_run(self, just_ran=False):
 		self.next_timestamp = 0
 
-	def is_due(self):
+	def is_due(self, now=None):
 		return False
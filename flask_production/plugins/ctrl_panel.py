@@ -91,28 +91,28 @@ class ControlPanel:
 				if 'running' not in mon['summary']:
 					mon['summary']['running'] = 0
 
-				err_msg_css = []
-				running_msg_css = []
+				err_msg_css = ''
+				running_msg_css = ''
 				if mon['summary']['errors'] > 0:
 					css.append('error-border')
-					err_msg_css = ['red']
+					err_msg_css = 'red'
 				if mon['summary']['running'] > 0:
-					running_msg_css = ['yellow']
+					running_msg_css = 'yellow'
 
 				task_msg = f"tasks: {DIV(mon['summary']['count'])}"
 				running_msg = f"running: {DIV(mon['summary']['running'], css=running_msg_css)}"
 				error_msg = f"errors: {DIV(mon['summary']['errors'], css=err_msg_css)}"
 
 				msg = f"{task_msg}  {running_msg}  {error_msg}"
-				elem = SPAN(B(mon['name']), css=['block-title']) + SPAN(msg, css=['block-msg'])
+				elem = SPAN(B(mon['name']), css='block-title') + SPAN(msg, css='block-msg')
 				attrs['data-url'] = monitor['url']
 				attrs['title'] = f"{mon['name']}\n{monitor['url']}"
-			content.append(DIV(elem, css=css, attrs=attrs))
+			content.append(DIV(elem, css=' '.join(css), attrs=attrs))
 			tot_jobs += mon['summary']['count']
 
 		wrapper = DIV(''.join(content), css='wrapper')
 		header_txt = f"Control Panel"
-		header = DIV(H(2, header_txt), css=['header-bar'])
+		header = DIV(H(2, header_txt), css='header-bar')
 		summary_txt = SMALL(f"Monitoring {tot_jobs} jobs")
 		rerun_txt = SMALL(f"Auto-refresh in {SPAN(self.page_refresh, attrs={'id': 'refresh-msg'})} seconds")
 
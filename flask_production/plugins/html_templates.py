@@ -3,72 +3,80 @@ ROOT = os.path.dirname(os.path.realpath(__file__))
 WEB_FOLDER = os.path.join(ROOT, 'web')
 
 
+_template_cache = {}
+
 def _readTemplate(fileName, **kwargs):
-	with open(fileName, 'r') as f:
-		templateText = f.read()
+	if fileName not in _template_cache: # read template files from disk only once
+		with open(fileName, 'r') as f:
+			_template_cache[fileName] = f.read()
+	templateText = _template_cache[fileName]
 	for arg in kwargs:
 		templateText = templateText.replace("{{ "+arg+" }}", str(kwargs[arg]))
 	return templateText
 
 
-def HTML(content, title, css=[]):
-	if not isinstance(css, (list,set,tuple)):
-		css = [css]
-	return _readTemplate(os.path.join(WEB_FOLDER, 'index.html'), title=title, body=str(content), body_css=' '.join(css))
+# note: 'css' arguments are expected to be pre-joined class strings (ex: "a b c")
+# - callers with a list of classes should ' '.join() them once, not per render
+
+def HTML(content, title, css=''):
+	return _readTemplate(os.path.join(WEB_FOLDER, 'index.html'), title=title, body=str(content), body_css=css)
+
+
+def HTML_PARTS(title, css=''):
+	'''page wrapper pre-split around the body placeholder - (head, tail) can be computed once and reused per request'''
+	page = _readTemplate(os.path.join(WEB_FOLDER, 'index.html'), title=title, body_css=css)
+	head, tail = page.split("{{ body }}")
+	return head, tail
 
 def _TAG(tag, content, css, attrs):
 	attrs = ['''{}="{}"'''.format(k,v) for k,v in attrs.items()]
-	if not isinstance(css, (list,set,tuple)):
-		css = [css]
-	attrs.append('''class="{}"'''.format(' '.join(css)))
+	attrs.append('''class="{}"'''.format(css))
 	return "<{t} {a}>{c}</{t}>".format(t=tag, a=' '.join(attrs), c=content)
 
-def H(index, content, css=[], attrs={}):
+def H(index, content, css='', attrs={}):
 	return _TAG('h{i}'.format(i=index), content, css, attrs)
 
-def B(content, css=[], attrs={}):
+def B(content, css='', attrs={}):
 	return _TAG('b', content, css, attrs)
 
-def I(content, css=[], attrs={}):
+def I(content, css='', attrs={}):
 	return _TAG('i', content, css, attrs)
 
-def SMALL(content, css=[], attrs={}):
+def SMALL(content, css='', attrs={}):
 	return _TAG('small', content, css, attrs)
 
-def SPAN(content, css=[], attrs={}):
+def SPAN(content, css='', attrs={}):
 	return _TAG('span', content, css, attrs)
 
-def DIV(content, css=[], attrs={}):
+def DIV(content, css='', attrs={}):
 	return _TAG('div', content, css, attrs)
 
-def TABLE(thead='', tbody='', elem_id='', css=[], attrs={}):
+def TABLE(thead='', tbody='', elem_id='', css='', attrs={}):
 	attrs['id'] = elem_id
 	return _TAG('table', '{}{}'.format(thead, tbody), css, attrs)
 
 def TH(h, default_sort=False):
 	return "<th {}>{}</th>".format("data-sort-default" if default_sort else "", h)
 
-def THEAD(th, css=[], attrs={}):
+def THEAD(th, css='', attrs={}):
 	return _TAG('thead', ''.join(th), css, attrs)
 
-def TBODY(rows, css=[], attrs={}):
+def TBODY(rows, css='', attrs={}):
 	return _TAG('tbody', ''.join(rows), css, attrs)
 
-def TD(content, colspan=1, rowspan=1, css=[], attrs={}):
+def TD(content, colspan=1, rowspan=1, css='', attrs={}):
 	attrs['colspan'] = colspan
 	attrs['rowspan'] = rowspan
 	return _TAG('td', content if content is not None else "-", css, attrs)
 
-def TR(row, css=[], attrs={}):
+def TR(row, css='', attrs={}):
 	return _TAG('tr', ''.join(row), css, attrs)
 
-def INPUT(content, css=[], attrs={}):
+def INPUT(content, css='', attrs={}):
 	return _TAG('input', content, css, attrs)
 
-def CODE(s, css=[]):
-	if not isinstance(css, (list,set,tuple)):
-		css = [css]
-	return '''<pre><code class="{}">{}</code></pre>'''.format(' '.join(css), s)
+def CODE(s, css=''):
+	return '''<pre><code class="{}">{}</code></pre>'''.format(css, s)
 
 def SCRIPT(s):
 	return "<script>{}</script>".format(s)
@@ -1,16 +1,74 @@
 from datetime import datetime as dt
-from collections import OrderedDict
+import gzip
 import json
+import re
 import random
 import string
 
 from dateutil import tz
-from flask import Flask, Blueprint, request, send_file
+from flask import Flask, Blueprint, request, send_file, Response
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 
 
 from .html_templates import * # pylint: disable=unused-wildcard-import
 
 
+# jinja2 compiles templates to python bytecode once - much cheaper than
+# re-running str.format chains for table-heavy pages on every request
+# - templates ship with the package in web/templates
+# - the bytecode cache (system temp dir) skips re-parsing them on process restart
+# - auto_reload off so renders don't stat the template files
+_JINJA_ENV = Environment(
+	loader=FileSystemLoader(os.path.join(WEB_FOLDER, 'templates')),
+	bytecode_cache=FileSystemBytecodeCache(),
+	auto_reload=False,
+	autoescape=False,
+)
+
+
+_HTMLIFY_MAP = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}
+_HTMLIFY_RE = re.compile('[&<>"]')
+
+def _htmlify(text):
+	'''escape raw job output so it can be embedded in the page
+	- single regex pass instead of chained .replace calls, each of which
+	  would scan and copy the full string'''
+	return _HTMLIFY_RE.sub(lambda m: _HTMLIFY_MAP[m.group()], text)
+
+
+
+class _JobRow(object):
+	'''lightweight row struct for the all-jobs table
+	- avoids allocating a hash table per job on every page render'''
+
+	__slots__ = (
+		'jobid', 'func', 'signature', 'schedule_td', 'descr_td',
+		'state', 'state_css', 'state_title',
+		'start', 'start_ts', 'end', 'end_ts',
+		'duration', 'next_run', 'next_ts',
+	)
+
+	def __init__(self, jobid, func, signature, schedule_td, descr_td,
+		state, state_css, state_title,
+		start, start_ts, end, end_ts,
+		duration, next_run, next_ts):
+		self.jobid = jobid
+		self.func = func
+		self.signature = signature
+		self.schedule_td = schedule_td
+		self.descr_td = descr_td
+		self.state = state
+		self.state_css = state_css
+		self.state_title = state_title
+		self.start = start
+		self.start_ts = start_ts
+		self.end = end
+		self.end_ts = end_ts
+		self.duration = duration
+		self.next_run = next_run
+		self.next_ts = next_ts
+
+
 
 class TaskMonitor(object):
 	'''
@@ -33,6 +91,11 @@ class TaskMonitor(object):
 	- can_disable (bool): if True adds `disable` button to job page
 		- default True
 	'''
+
+	# compiled jinja2 templates - cached on the class so they are shared across instances
+	_all_page_tpl = None
+	_one_page_tpl = None
+
 	def __init__(self, app:Flask, sched, display_name=None, endpoint="@taskmonitor", homepage_refresh=30, taskpage_refresh=5,
 		can_rerun=True, # adds rerun button to job page
 		can_disable=True, # adds disable button to job page
@@ -50,6 +113,19 @@ class TaskMonitor(object):
 		self._can_rerun = can_rerun
 		self._can_disable = can_disable
 
+		# the page wrapper never changes once the title is known - compute it once here
+		# pre-encoded to bytes so each request only utf-8 encodes the rendered body
+		html_head, html_tail = HTML_PARTS(title="{} Task Monitor".format(self._display_name))
+		self._html_head = html_head.encode()
+		self._html_tail = html_tail.encode()
+		self._css_links = self.__css_src_wrap('dark_theme.css') + self.__css_src_wrap('taskmonitor.css')
+		self._schedule_td_cache = {} # jobid -> rendered schedule cell (schedules are fixed at job creation)
+		self._log_html_cache = {} # (jobid, log key) -> (text hash, escaped html)
+
+		if TaskMonitor._all_page_tpl is None: # load page templates only once
+			TaskMonitor._all_page_tpl = _JINJA_ENV.get_template('taskmonitor_all.html')
+			TaskMonitor._one_page_tpl = _JINJA_ENV.get_template('taskmonitor_one.html')
+
 		bp = Blueprint('taskmonitor_bp', __name__, url_prefix=f"/{self._endpoint}")
 
 		bp.add_url_rule("", view_func=self.__show_all, methods=['GET'])
@@ -58,6 +134,7 @@ class TaskMonitor(object):
 		bp.add_url_rule("/enable_disable", view_func=self.__enable_disable_job, methods=['POST'])
 		bp.add_url_rule("/json/all", view_func=self.__get_all_json, methods=['GET'])
 		bp.add_url_rule("/json/summary", view_func=self.__get_summary_json, methods=['GET'])
+		bp.add_url_rule("/json/states", view_func=self.__get_states_json, methods=['GET'])
 		bp.add_url_rule("/json/<int:n>", view_func=self.__get_one_json, methods=['GET'])
 
 		bp.add_url_rule("/static/<type>/<filename>", view_func=self.__serve_file, methods=['GET'])
@@ -72,8 +149,23 @@ class TaskMonitor(object):
 			self.app.add_url_rule("/favicon.ico", view_func=lambda: self.__serve_file('ico', 'flask_boiler.ico'), methods=['GET'])
 
 
-	def __html_wrap(self, elems, css=[]):
-		return HTML(''.join(elems), title="{} Task Monitor".format(self._display_name), css=css)
+	def __html_wrap(self, elems):
+		return b''.join((self._html_head, *(e.encode() for e in elems), self._html_tail))
+
+	def __html_response(self, body):
+		'''
+		wrap a rendered page (bytes) in a Response
+		- monitor pages are polled on a timer, so compress when the client allows it
+		- html compresses well (typically ~70% smaller)
+		'''
+		resp = Response(body, mimetype='text/html')
+		resp.headers['Cache-Control'] = 'no-store'
+		if len(body) > 500 and 'gzip' in request.accept_encodings: # don't bother with tiny payloads
+			resp.set_data(gzip.compress(body, 5))
+			resp.headers['Content-Encoding'] = 'gzip'
+			resp.headers['Vary'] = 'Accept-Encoding'
+		resp.headers['Content-Length'] = str(len(resp.get_data()))
+		return resp
 
 	def __js_src_wrap(self, filename):
 		return SCRIPT_SRC(f'/{self._endpoint}/static/js/{filename}')
@@ -123,42 +215,26 @@ class TaskMonitor(object):
 
 
 	def __scheduleTD(self, jdict):
-		tz_str = ''
-		if isinstance(jdict['tzname'], str):
-			tz_str = dt.now(tz.gettz(jdict['tzname'])).strftime("[%Z]")
-
-		if isinstance(jdict['every'], int): # jdict['type']=='RepeatJob'
-			out = "every {} seconds {}".format(jdict['every'], tz_str)
-			return TD(out.strip())
-
-		elif jdict['type']=='OneTimeJob':
-			out = "on {} at {} {}".format(jdict['every'], jdict['at'], tz_str)
-			return TD(out.strip())
-
-		elif jdict['type']=='NeverJob':
-			out = 'on-demand'
-			return TD(out)
-
-		elif isinstance(jdict['at'], (list,set,tuple)):
-			full_str = "every {} at {} {}".format(jdict['every'], ', '.join(jdict['at']), tz_str)
-
-			if len(jdict['at']) >= 5:
-				at_str = ', '.join(jdict['at'][:3]) + ', ...' + jdict['at'][-1]
-				out = "every {} at {} {}".format(jdict['every'], at_str, tz_str)
-				return TD(out.strip(), attrs={'title': full_str.strip()})
+		td = self._schedule_td_cache.get(jdict['jobid'])
+		if td is None: # rendered at most once per job - jobids are never reused
+			full_str = jdict['schedule_str'] # pre-formatted once on the Job
+			at = jdict['at']
+			if isinstance(at, (list,set,tuple)) and len(at) >= 5:
+				# shorten long lists of times - full schedule shown as tooltip
+				short_str = full_str.replace(', '.join(at), ', '.join(at[:3]) + ', ...' + at[-1])
+				td = TD(short_str, attrs={'title': full_str})
 			else:
-				return TD(full_str.strip())
-		else:
-			out = "every {} at {} {}".format(jdict['every'], jdict['at'], tz_str)
-			return TD(out.strip())
+				td = TD(full_str)
+			self._schedule_td_cache[jdict['jobid']] = td
+		return td
 
 
 	def __date_fmt(self, d):
 		fallback = '-'+('&nbsp;'*30) # a hiphen and some html spaces
 		return d.strftime("%Y-%m-%d %H:%M:%S %Z") if d is not None else fallback
 
-	def __date_sort_attr(self, d):
-		return {'data-sort': d.timestamp() if d is not None else 0}
+	def __date_sort_ts(self, d):
+		return d.timestamp() if d is not None else 0
 
 	def __descrTD(self, d):
 		if d is None: return TD('-')
@@ -205,154 +281,140 @@ class TaskMonitor(object):
 			out = {'name': self._display_name, 'summary': summary, 'details': details}
 			return json.dumps({'success': out}, default=str)
 
+	def __get_states_json(self):
+		'''
+		lightweight polling endpoint for the home page
+		- only the fields that change between refreshes, so the 30 second
+		  auto-refresh doesn't need to re-render and re-download the full page
+		'''
+		states = []
+		for j in self.sched.jobs:
+			jd = j.to_dict()
+			state = self.__state(jd)
+			start_dt = jd['logs']['start']
+			end_dt = jd['logs']['end']
+			states.append(dict(
+				id=jd['jobid'],
+				state=state['state'],
+				state_css=state['css'],
+				state_title=state['title'],
+				start=self.__date_fmt(start_dt),
+				start_ts=self.__date_sort_ts(start_dt),
+				end=self.__date_fmt(end_dt),
+				end_ts=self.__date_sort_ts(end_dt),
+				duration=self.__duration(jd) or '-',
+				next_run=self.__next_run_str(jd),
+				next_ts=self.__date_sort_ts(jd['next_run']),
+			))
+		return json.dumps({'success': states})
+
 	def __get_one_json(self, n):
 		j = self.sched.get_job_by_id(n)
 		if j is None:
 			return json.dumps({'error':'Invalid job id'})
 		return json.dumps({'success': j.to_dict()}, default=str)
 
+	def __htmlified_log(self, jobid, key, text):
+		'''escape job log text for the task page, cached per job
+		- log buffers can get large and the task page polls every few seconds,
+		  so re-escape only when the text changes (hashing is a single scan vs
+		  multiple replace passes each copying the string)'''
+		text_hash = hash(text)
+		cached = self._log_html_cache.get((jobid, key))
+		if cached is not None and cached[0]==text_hash:
+			return cached[1]
+		html = _htmlify(text)
+		self._log_html_cache[(jobid, key)] = (text_hash, html)
+		return html
+
+	def __next_run_str(self, jdict):
+		if jdict['next_run'] is None:
+			return 'Disabled' if jdict['is_disabled'] else 'Never'
+		return self.__date_fmt(jdict['next_run'])
+
+	def __job_row(self, j):
+		'''build one template row context for the all-jobs table'''
+		jd = j.to_dict()
+		duration = self.__duration(jd)
+		state = self.__state(jd)
+		start_dt = jd['logs']['start']
+		end_dt = jd['logs']['end']
+		next_dt = jd['next_run']
+		next_dt_str = self.__next_run_str(jd)
+
+		return _JobRow(
+			jobid=jd['jobid'],
+			func=jd['func'].replace('<', '&lt;').replace('>', '&gt;'),
+			signature=j.func_signature(),
+			schedule_td=self.__scheduleTD(jd),
+			descr_td=self.__descrTD(jd['doc']),
+			state=state['state'],
+			state_css=state['css'],
+			state_title=state['title'],
+			start=self.__date_fmt(start_dt),
+			start_ts=self.__date_sort_ts(start_dt),
+			end=self.__date_fmt(end_dt),
+			end_ts=self.__date_sort_ts(end_dt),
+			duration=duration if duration is not None else '-',
+			next_run=next_dt_str,
+			next_ts=self.__date_sort_ts(next_dt),
+		)
+
 	def __show_all(self):
 		if len(self.sched.jobs)==0:
 			return 'Nothing here'
-		d = []
-		for j in self.sched.jobs:
-			jd = j.to_dict()
-			duration = self.__duration(jd)
-			state = self.__state(jd)
-			start_dt = jd['logs']['start']
-			end_dt = jd['logs']['end']
-			next_dt = jd['next_run']
-			next_dt_str = ''
-			if next_dt is None:
-				if jd['is_disabled']:
-					next_dt_str = 'Disabled'
-				else:
-					next_dt_str = 'Never'
-			else:
-				next_dt_str = self.__date_fmt(next_dt)
-
-			d.append(OrderedDict({
-				'Id': TD(jd['jobid']),
-				'Name': TD(jd['func'].replace('<', '&lt;').replace('>', '&gt;'), attrs={'title':j.func_signature()}),
-				'Schedule': self.__scheduleTD(jd),
-				'Description': self.__descrTD(jd['doc']),
-				'State': TD(state['state'], css=state['css'], attrs={'title': state['title']}),
-				'Start': TD(self.__date_fmt(start_dt), attrs=self.__date_sort_attr(start_dt)),
-				'End': TD(self.__date_fmt(end_dt), attrs=self.__date_sort_attr(end_dt)),
-				'Time Taken': TD(duration),
-				'Next Run': TD(next_dt_str, attrs=self.__date_sort_attr(next_dt)),
-				'More':TD("<a href='/{}/{}'><button>show more</button><a>".format(self._endpoint, jd['jobid']))
-			}))
-		rows = [TR(row.values()) for row in d]
-		head = [TH(th, default_sort=(th=="Next Run") ) for th in d[0].keys()]	# apply sorting to 'next run'
-		all_jobs_table = TABLE(thead=THEAD(head), tbody=TBODY(rows), elem_id='all-jobs', css='all-jobs')
-		refresh_text = SMALL(f"Auto-refresh in {SPAN(self._homepage_refresh, attrs={'id': 'refresh-msg'})} seconds")
-		filter_input = INPUT("", attrs={'type':'text', 'placeholder':'Filter', 'id': 'filter-box'})
-
-		js_auto_reload_variables = '''let COUNT_DOWN = {};'''.format(self._homepage_refresh)
-
-		container = DIV(
-			'\n'.join([
-				H(2, "{} - Task Monitor".format(self._display_name)),
-				SPAN("Running since {}".format(self._init_dt)),
-				refresh_text,
-				filter_input,
-				all_jobs_table,
-			]),
-			css=["container", "container-vertical", 'center']
-		)
-
-		return self.__html_wrap(
-			[
-				self.__css_src_wrap('dark_theme.css'),
-				self.__css_src_wrap('taskmonitor.css'),
-				container,
-				SCRIPT(js_auto_reload_variables),
-				self.__js_src_wrap('taskmonitor.js')
-			]
+		body = self._all_page_tpl.render(
+			css_links=self._css_links,
+			display_name=self._display_name,
+			init_dt=self._init_dt,
+			homepage_refresh=self._homepage_refresh,
+			endpoint=self._endpoint,
+			rows=[self.__job_row(j) for j in self.sched.jobs],
 		)
+		return self.__html_response(self.__html_wrap((body,)))
 
 	def __show_one(self, n):
 		j = self.sched.get_job_by_id(n)
 		if j is None:
 			return 'Not found'
 		jobd = j.to_dict()
-		titleTD = lambda t: TD(t, css='title')
 		state = self.__state(jobd)
 		job_funcname = jobd['func'].replace('<', '&lt;').replace('>', '&gt;')
 
-		enable_disable_btn = '''<button class="btn enable-disable-btn"
-									onclick="enable_disable('{name}', {jobid}, {job_disable})"
-									{btn_disabled}>
-								{btn_name}
-								</button>'''.format(
-			name=job_funcname, jobid=n,
-			job_disable="true" if not jobd['is_disabled'] else "false",
-			btn_disabled="disabled" if state['state']=="RUNNING" else "",
-			btn_name="Disable" if not jobd['is_disabled'] else "Enable",
-		)
-		rerun_btn = '''<button class="btn rerun-btn"
-							onclick="rerun_trigger('{name}', {jobid})"
-							{btn_disabled}>
-						Rerun
-						</button>'''.format(
-			name=job_funcname, jobid=n, # rerun_trigger params
-			btn_disabled="disabled" if state['state']=="RUNNING" or jobd['is_disabled'] else ""
-		)
-		rows = [
-			TR([ titleTD("Schedule"), self.__scheduleTD(jobd), ]),
-			TR([ titleTD("State"), TD(state['state'], css=state['css']) ]),
-			TR([ titleTD("Start Time"), TD(self.__date_fmt(jobd['logs']['start'])) ]),
-			TR([ titleTD("End Time"), TD(self.__date_fmt(jobd['logs']['end'])) ]),
-			TR([ titleTD("Time Taken"), TD(self.__duration(jobd)) ]),
-			TR([ titleTD("Next Run In"), TD("-", attrs={'id':'next-run-in'}) ]),
-			TR([ TD(enable_disable_btn, colspan=2, css=['monitor-btn']) ]) if self._can_disable else '',
-			TR([ TD(rerun_btn, colspan=2, css=['monitor-btn']) ]) if self._can_rerun else ''
-		]
-
-		info_table = TABLE(tbody=TBODY(rows), css='info_table')
-		description_div = DIV( CODE(jobd['src'], css='python'), css=['console-color', 'console-div', 'brdr', 'monitor-code'])
-		title = H(2, job_funcname, attrs={'title': j.func_signature()})
-		monitor_div = DIV(
-			title + info_table + description_div,
-			css="monitor"
-		)
-
-		logs_row = TR([
-			TD( DIV( CODE(jobd['logs']['log'], css='accesslog'), css='console-div'), css="console-color"),
-			TD( DIV( CODE(jobd['logs']['err'], css='accesslog'), css='console-div'), css="console-color"),
-		])
-		logs_table = TABLE(thead=THEAD([TH('Logs'), TH('Traceback')]), tbody=TBODY(logs_row), css='log_table')
-		logs_div = DIV( logs_table, css="logs_div" )
-
-		container = DIV(
-			monitor_div + logs_div,
-			css="container"
-		)
-
 		next_run_ts = '"Never"'
 		if jobd['is_disabled']:
 			next_run_ts = '"Disabled"'
 		elif jobd['next_run']:
 			next_run_ts = jobd['next_run'].timestamp()
 
-		variables_script = f'''
-		let RUNNING = {int(jobd['is_running'])};
-		let NEXT_RUN = {next_run_ts};
-		let ERR_LINE = {self.__src_err_line(jobd)};
-		let TASKPAGE_REFRESH = {self._taskpage_refresh};
-		let API_TOKEN = '{self._api_protection_token}';
-		'''
-
-		return self.__html_wrap(
-			[
-				self.__css_src_wrap('dark_theme.css'),
-				self.__css_src_wrap('taskmonitor.css'),
-				container,
-				SCRIPT(variables_script),
-				self.__js_src_wrap('task.js')
-			]
+		body = self._one_page_tpl.render(
+			css_links=self._css_links,
+			endpoint=self._endpoint,
+			jobid=n,
+			func=job_funcname,
+			signature=j.func_signature(),
+			schedule_td=self.__scheduleTD(jobd),
+			state=state['state'],
+			state_css=state['css'],
+			start=self.__date_fmt(jobd['logs']['start']),
+			end=self.__date_fmt(jobd['logs']['end']),
+			duration=self.__duration(jobd) or '-',
+			src=jobd['src'],
+			log=self.__htmlified_log(n, 'log', jobd['logs']['log']),
+			err=self.__htmlified_log(n, 'err', jobd['logs']['err']),
+			can_disable=self._can_disable,
+			disable_btn_arg="true" if not jobd['is_disabled'] else "false",
+			disable_btn_disabled="disabled" if state['state']=="RUNNING" else "",
+			disable_btn_name="Disable" if not jobd['is_disabled'] else "Enable",
+			can_rerun=self._can_rerun,
+			rerun_btn_disabled="disabled" if state['state']=="RUNNING" or jobd['is_disabled'] else "",
+			running=int(jobd['is_running']),
+			next_run_ts=next_run_ts,
+			err_line=self.__src_err_line(jobd),
+			taskpage_refresh=self._taskpage_refresh,
+			api_token=self._api_protection_token,
 		)
+		return self.__html_response(self.__html_wrap((body,)))
 
 
 	def __rerun_job(self):
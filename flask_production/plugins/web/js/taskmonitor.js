@@ -3,14 +3,45 @@ const filter_box = document.getElementById("filter-box");
 new Tablesort(table);
 const tf = new TableFilter(table, filter_box)
 
+function update_cell(row, col, html, sortval, css, title) {
+    const cell = row.querySelector(`td[data-col='${col}']`)
+    if (!cell) return
+    cell.innerHTML = html
+    if (sortval !== undefined) cell.setAttribute('data-sort', sortval)
+    if (css !== undefined) cell.className = css
+    if (title !== undefined) cell.title = title
+}
+
+// patch the table in place from the lightweight states endpoint
+// instead of re-rendering and re-downloading the whole page
+function refresh_states() {
+    fetch(JSON_STATES_URL).then(resp => {
+        return resp.json();
+    }).then(res => {
+        if (!res.success) throw Error("no states")
+        const states = res.success
+        const rows = table.querySelectorAll("tbody tr")
+        if (rows.length !== states.length) throw Error("job list changed") // needs a full render
+        states.forEach(s => {
+            const row = table.querySelector(`tr[data-jobid='${s.id}']`)
+            if (!row) return
+            update_cell(row, 'state', s.state, undefined, s.state_css, s.state_title)
+            update_cell(row, 'start', s.start, s.start_ts)
+            update_cell(row, 'end', s.end, s.end_ts)
+            update_cell(row, 'duration', s.duration)
+            update_cell(row, 'next-run', s.next_run, s.next_ts)
+        })
+    }).catch(() => location.reload())
+}
+
 window.addEventListener('load', (event) => {
     const timer = setInterval(()=>{
         if (COUNT_DOWN > 0) {
             COUNT_DOWN --
             document.getElementById('refresh-msg').innerText = COUNT_DOWN
         } else {
-            clearInterval(timer)
-            location.reload()
+            COUNT_DOWN = HOMEPAGE_REFRESH // restart the countdown before the fetch resolves
+            refresh_states()
         }
     }, 1000)
 })
@@ -19,6 +19,14 @@ LOGGER.setLevel(logging.INFO)
 # stop propagting to root logger
 LOGGER.propagate = False
 
+# scheduler messages (job registration, start/stop, ..)
+# - has its own console handler so messages stay visible like the print() calls they replace
+# - propagates to LOGGER so they also reach the log file when one is configured
+# - can be silenced with SCHED_LOGGER.setLevel()
+SCHED_LOGGER = logging.getLogger(LOGGER_NAME + '.sched')
+SCHED_LOGGER.setLevel(logging.INFO)
+SCHED_LOGGER.addHandler(logging.StreamHandler(sys.stderr))
+
 
 
 
@@ -9,7 +9,8 @@ from dateutil import tz
 
 from .print_logger import (
 	LOGGER,
-	LOG_FORMATTER
+	LOG_FORMATTER,
+	SCHED_LOGGER
 )
 
 from .jobs import (
@@ -22,7 +23,10 @@ from .jobs import (
 	NeverJob,
 
 	# exceptions
-	BadScheduleError
+	BadScheduleError,
+
+	# helpers
+	get_tz,
 )
 
 from .script_func import ScriptFunc
@@ -34,7 +38,21 @@ from .state import (
 
 
 
-USHolidays = holidays.US()
+_USHolidays = None
+
+def get_us_holidays():
+	'''default US holiday calendar - built lazily since users may supply their own'''
+	global _USHolidays
+	if _USHolidays is None:
+		_USHolidays = holidays.US()
+	return _USHolidays
+
+
+def __getattr__(name):
+	# PEP 562 - keep the old module-level USHolidays attribute working without constructing it at import
+	if name == 'USHolidays':
+		return get_us_holidays()
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_local_timezone_name():
@@ -72,20 +90,23 @@ class TaskScheduler(object):
 		state_handler: Union[BaseStateHandler, None]=None) -> None:
 
 		self.jobs = []
+		self._jobs_by_id = {} # index for O(1) get_job_by_id lookups
+		self._jobs_version = 0 # bumped whenever the jobs list mutates - lets check() detect changes without copying
+		self._async_jobs = [] # AsyncJobWrapper jobs only - saves join() from scanning the full list
 		self._check_interval = check_interval
 		self._startup_grace_mins = startup_grace_mins
 		self.on_job_error = on_job_error
 
 		tzname = tzname or get_local_timezone_name() # if None, default to local timezone
-		if tz.gettz(tzname) is None:
+		if get_tz(tzname) is None:
 			raise ValueError(f"unknown timezone '{tzname}'")
 		self._tz_default = tzname
-		print("* Default Timezone:", self._tz_default, "*")
+		SCHED_LOGGER.info("* Default Timezone: %s *", self._tz_default)
 
 		if holidays_calendar is not None:
 			self.holidays_calendar = holidays_calendar
 		else:
-			self.holidays_calendar = USHolidays
+			self.holidays_calendar = get_us_holidays()
 
 		# setup logging
 		self.log_filepath = log_filepath
@@ -167,7 +188,7 @@ class TaskScheduler(object):
 		- example US/Eastern
 		- defaults to system timezone
 		'''
-		test = tz.gettz(tzname)
+		test = get_tz(tzname)
 		if test is None:
 			raise BadScheduleError(f"unknown timezone '{tzname}'")
 		self.tzname = tzname
@@ -187,7 +208,7 @@ class TaskScheduler(object):
 		if self.interval is None:
 			raise Exception('Use .at()/.every().at() before .do()')
 		if self.temp_time is None:
-			self.temp_time = dt.now(tz.gettz(self.tzname)).strftime("%H:%M")
+			self.temp_time = dt.now(get_tz(self.tzname)).strftime("%H:%M")
 
 		new_jobid = len(self.jobs)
 		j = None
@@ -228,40 +249,48 @@ class TaskScheduler(object):
 			j.register_callback(self._state_handler.save_job_logs, cb_type="oncomplete")
 
 		self.__reset_defaults()
-		print(j)
+		SCHED_LOGGER.info("%s", j) # lazily formatted - skipped entirely if the level is raised
 		return j
 
 
+	def _add_job(self, j):
+		'''register newly created job with the scheduler'''
+		self.jobs.append(j)
+		self._jobs_by_id[j.jobid] = j # works for AsyncJobWrapper too since it delegates attribute access
+		self._jobs_version += 1
+		if isinstance(j, AsyncJobWrapper):
+			self._async_jobs.append(j)
+
 	def do(self, func, do_parallel=False, **kwargs):
 		j = self._create_job(func, **kwargs)
 		if do_parallel:
-			print("================================================")
-			print("==== do_parallel boolean argument will be removed")
-			print("==== use do_parallel() method  instead")
-			print("================================================")
+			SCHED_LOGGER.warning("================================================")
+			SCHED_LOGGER.warning("==== do_parallel boolean argument will be removed")
+			SCHED_LOGGER.warning("==== use do_parallel() method  instead")
+			SCHED_LOGGER.warning("================================================")
 			warnings.warn("do_parallel boolean argument will be removed", category=DeprecationWarning)
 			j = AsyncJobWrapper(j)
-		self.jobs.append(j)
+		self._add_job(j)
 		return j
 
 	def do_parallel(self, func, **kwargs):
 		'''helper function to run job in a separate thread'''
 		j = self._create_job(func, **kwargs)
 		j = AsyncJobWrapper(j)
-		self.jobs.append(j)
+		self._add_job(j)
 		return j
 
 	def run_script(self, script_dir_path:str, script_name:str, script_args:List[str]=[]):
 		func = ScriptFunc(script_dir_path, script_name, script_args)
 		j = self._create_job(func)
-		self.jobs.append(j)
+		self._add_job(j)
 		return j
 
 	def run_script_parallel(self, script_dir_path:str, script_name:str, script_args:List[str]=[]):
 		func = ScriptFunc(script_dir_path, script_name, script_args)
 		j = self._create_job(func)
 		j = AsyncJobWrapper(j)
-		self.jobs.append(j)
+		self._add_job(j)
 		return j
 
 	# -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=
@@ -270,11 +299,35 @@ class TaskScheduler(object):
 
 	def check(self):
 		'''check if a job is due'''
-		for j in self.jobs.copy(): # work on a shallow copy of this list - safer in case the list changes. TODO: maybe use locks instead?
-			if j.is_due() and not j.is_running:
+		# iterate by index instead of copying the list every tick
+		# - the list only grows (see _add_job); if it changes mid-scan, bail out and let the next tick pick up from a clean state
+		ver = self._jobs_version
+		now = time.time()
+		for i in range(len(self.jobs)):
+			if ver != self._jobs_version:
+				break
+			j = self.jobs[i]
+			# cheap next_timestamp filter first - skips the is_due() method call
+			# for the vast majority of jobs that aren't due. is_due() stays authoritative
+			ts = j.next_timestamp
+			if ts and now >= ts and not j.is_running and j.is_due(now):
 				j.run()
 
 
+	def _seconds_until_next_due(self):
+		'''
+		seconds until the soonest scheduled job, capped at check_interval
+		- the cap keeps the loop responsive to jobs added / enabled while sleeping
+		- jobs with no upcoming run (or already due and running) fall back to the cap
+		'''
+		now = time.time()
+		wait = self._check_interval
+		for j in self.jobs:
+			ts = j.next_timestamp
+			if ts > now and (ts - now) < wait:
+				wait = ts - now
+		return wait
+
 	def restore_all_job_logs(self):
 		try:
 			if isinstance(self._state_handler, BaseStateHandler):
@@ -282,7 +335,7 @@ class TaskScheduler(object):
 		except Exception as e:
 			# import traceback
 			# traceback.print_exc()
-			print("unable to restore states:", str(e))
+			SCHED_LOGGER.error("unable to restore states: %s", str(e))
 
 
 	def start(self):
@@ -293,31 +346,28 @@ class TaskScheduler(object):
 			while self._running_auto:
 				try:
 					self.check()
-					time.sleep(self._check_interval)
+					time.sleep(self._seconds_until_next_due()) # sleep only as long as needed instead of a full interval
 				except KeyboardInterrupt:
-					print("KeyboardInterrupt")
+					SCHED_LOGGER.info("KeyboardInterrupt")
 					self.stop()
 		finally:
-			print("Stopping. Please wait, checking active async jobs ..")
+			SCHED_LOGGER.info("Stopping. Please wait, checking active async jobs ..")
 			self.join()
-		print(self, "Done!")
+		SCHED_LOGGER.info("%s Done!", self)
 
 	def join(self):
 		'''wait for any async jobs to complete'''
-		for j in self.jobs:
-			if isinstance(j, AsyncJobWrapper) and j.is_running: # wait for any running parallel tasks
+		for j in self._async_jobs: # wait for any running parallel tasks
+			if j.is_running:
 				j.proc.join()
-				print(j, "exited")
+				SCHED_LOGGER.info("%s exited", j)
 
 	def stop(self):
 		'''stop job started with .start() method'''
 		self._running_auto = False
 
 	def get_job_by_id(self, jobid):
-		for j in self.jobs:
-			if j.jobid==jobid:
-				return j
-		return None
+		return self._jobs_by_id.get(jobid)
 
 	def rerun(self, jobid, kwargs: dict=None):
 		selected_job = self.get_job_by_id(jobid)
@@ -1,5 +1,7 @@
 import os
+import json
 import pickle
+from datetime import datetime as dt
 
 from .base import BaseStateHandler
 
@@ -46,24 +48,54 @@ class FileSystemState(BaseStateHandler):
 	def save_job_logs(self, job_obj):
 		if self._job_state_dir is not None:
 			filename = job_obj.signature_hash()
-			with open(os.path.join(self._job_state_dir, f"{filename}.pickle"), 'wb') as f:
-				logs = job_obj._logs_to_dict()
-				pickle.dump({'logs':logs, 'disabled': job_obj.is_disabled}, f) # we only care about logs
+			logs = job_obj._logs_to_dict()
+			state = {
+				'logs': {
+					'log': logs.get('log'),
+					'err': logs.get('err'),
+					# datetimes saved as timezone aware isoformat strings
+					'start': logs['start'].isoformat() if logs.get('start') is not None else None,
+					'end': logs['end'].isoformat() if logs.get('end') is not None else None,
+				},
+				'disabled': job_obj.is_disabled
+			}
+			with open(os.path.join(self._job_state_dir, f"{filename}.json"), 'w') as f:
+				json.dump(state, f, separators=(",", ":")) # we only care about logs
+
+
+	def _read_job_state(self, signature):
+		'''read saved state for a job signature - returns None if no state was saved'''
+		filepath = os.path.join(self._job_state_dir, f"{signature}.json")
+		if os.path.isfile(filepath):
+			with open(filepath, 'r') as f:
+				state = json.load(f)
+			logs = state['logs'] if 'logs' in state else state
+			logs['start'] = dt.fromisoformat(logs['start']) if logs.get('start') is not None else None
+			logs['end'] = dt.fromisoformat(logs['end']) if logs.get('end') is not None else None
+			return state, f"{signature}.json"
+
+		# fall back to the legacy pickle format so states survive an upgrade
+		# - the stale file cleanup below removes the old file once the state is re-saved as json
+		legacy_filepath = os.path.join(self._job_state_dir, f"{signature}.pickle")
+		if os.path.isfile(legacy_filepath):
+			with open(legacy_filepath, 'rb') as f:
+				state = pickle.load(f)
+			if 'logs' not in state: # doing it this way for backwards compatibility as 'state' was previously 'logs'
+				state = {'logs': state, 'disabled': False}
+			return state, f"{signature}.pickle"
+
+		return None, None
 
 
 	def restore_all_job_logs(self, jobs_list):
 		if self._job_state_dir is not None:
 			found_states = []
 			for j in jobs_list.copy(): # work on a shallow copy of this list - safer in case the list changes. TODO: maybe use locks instead?
-				filename = f"{j.signature_hash()}.pickle"
-				filepath = os.path.join(self._job_state_dir, filename)
-				if os.path.isfile(filepath):
-					with open(filepath, 'rb') as f:
-						state = pickle.load(f)
-						logs = state['logs'] if 'logs' in state else state # doing it this way for backwards compatibility as 'state' was previously 'logs'
-						j._logs_from_dict(logs)
-						if state.get('disabled'):
-							j.disable()
+				state, filename = self._read_job_state(j.signature_hash())
+				if state is not None:
+					j._logs_from_dict(state['logs'])
+					if state.get('disabled'):
+						j.disable()
 					found_states.append(filename)
 					# print("restored", j)
 			# clean up other states that did not match current jobs list (possible stale)
@@ -556,18 +556,18 @@ def test_fs_persistent_logs():
 
 	jobs_state_dir = s._state_handler._job_state_dir
 	for j in [j1, j2]:
-		state_file = os.path.join(jobs_state_dir ,f"{j.signature_hash()}.pickle")
+		state_file = os.path.join(jobs_state_dir ,f"{j.signature_hash()}.json")
 		assert(os.path.isfile(state_file))
 
-		import pickle
-		with open(state_file, 'rb') as f:
-			state = pickle.load(f)
+		import json
+		with open(state_file, 'r') as f:
+			state = json.load(f)
 			data = state['logs']
-		assert(isinstance(data['start'], dt))
-		assert(isinstance(data['end'], dt))
+		assert(isinstance(dt.fromisoformat(data['start']), dt))
+		assert(isinstance(dt.fromisoformat(data['end']), dt))
 		assert(state['disabled']==False)
 
-		assert(j._run_info._ended_at==data['end'])
+		assert(j._run_info._ended_at==dt.fromisoformat(data['end']))
 
 	s = TaskScheduler(persist_states=False)
 	j = s.every(1).do(job, x="hello", y="state")